@@ -4,14 +4,34 @@ AeroTrace Data Models
 Core data structures for aviation engine monitoring system telemetry.
 """
 
-from .engine import EngineData, Cylinder, Cylinders, RPM, Fuel, Oil, Electrical
+from .engine import (
+    CYLINDER_DTYPE,
+    ENGINE_DATA_DTYPE,
+    MAX_CYLINDERS,
+    EngineData,
+    EngineDataFrame,
+    Cylinder,
+    Cylinders,
+    RPM,
+    Fuel,
+    Oil,
+    Electrical,
+    is_missing,
+    make_cylinders_class,
+)
 
 __all__ = [
+    "CYLINDER_DTYPE",
+    "ENGINE_DATA_DTYPE",
+    "MAX_CYLINDERS",
     "EngineData",
+    "EngineDataFrame",
     "Cylinder",
     "Cylinders",
     "RPM",
     "Fuel",
     "Oil",
     "Electrical",
+    "is_missing",
+    "make_cylinders_class",
 ]
@@ -0,0 +1,33 @@
+"""
+Numba-compiled kernels for cylinder reductions
+
+Importing this module requires Numba; models.engine falls back to pure
+Python when it is not installed.
+"""
+
+import numba
+
+
+@numba.njit(cache=True)
+def minmax(values):
+    """Find the (coolest, hottest) positions in a 1-D array, skipping NaN
+
+    Ties resolve to the first occurrence, matching Cylinders._minmax.
+    Returns (-1, -1) when every value is NaN or the array is empty.
+    """
+    lo = hi = 0.0
+    lo_index = hi_index = -1
+
+    for index in range(values.shape[0]):
+        value = values[index]
+        if value != value:  # NaN
+            continue
+        if hi_index < 0:
+            lo = hi = value
+            lo_index = hi_index = index
+        elif value > hi:
+            hi, hi_index = value, index
+        elif value < lo:
+            lo, lo_index = value, index
+
+    return lo_index, hi_index
@@ -2,14 +2,141 @@
 Data models for standardized EMS telemetry representation
 """
 
-from dataclasses import asdict, dataclass, field
-from typing import List, Optional
+from __future__ import annotations
+
+import math
+import sys
+from array import array
+from dataclasses import asdict, dataclass, field, fields
+from operator import attrgetter
+from pathlib import Path
+from typing import (
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    Union,
+)
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; Cylinders falls back to array.array
+    np = None
+
+try:
+    from ._kernels import minmax as _minmax_kernel
+except ImportError:  # Numba is optional
+    _minmax_kernel = None
+
+# Above this many readings NumPy's vectorised argmin/argmax beat the
+# branchy compiled loop, whose advantage is its low per-call overhead
+_KERNEL_MAX_READINGS = 128
+
+# dataclass(slots=True) is only available from Python 3.10; on 3.9 the
+# per-sample models keep their instance __dict__
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+# Packed record layout accepted by Cylinders.from_buffer
+CYLINDER_DTYPE = (
+    np.dtype([("number", "<i4"), ("value", "<f8")]) if np is not None else None
+)
+
+
+# Largest cylinder number the int32 storage holds; np.iinfo is slow to build
+_INT32_MAX = 2**31 - 1
+
+
+def _owned_array(data: np.ndarray, dtype) -> np.ndarray:
+    """Return data as a contiguous array of dtype that no caller can modify
+
+    Contiguous arrays of the right dtype are shared only when they view an
+    immutable buffer such as ``bytes``; anything else is copied.
+    """
+    if data.dtype == dtype and data.flags.c_contiguous and _is_frozen(data):
+        return data
+    return np.array(data, dtype=dtype)
+
+
+def _is_frozen(data: np.ndarray) -> bool:
+    """Check that an array views memory nobody can write to
+
+    A read-only flag alone is not enough: whoever owns an array's memory can
+    set it writeable again. Only arrays whose memory ultimately comes from a
+    read-only buffer object qualify.
+    """
+    base = data
+    while isinstance(base, np.ndarray):
+        if base.flags.writeable:
+            return False
+        base = base.base
+    if base is None:  # The chain ends at an array that owns its memory
+        return False
+    try:
+        return memoryview(base).readonly
+    except TypeError:
+        return False
+
+
+def _require_numpy(feature: str) -> None:
+    """Raise ImportError if NumPy, needed by the given feature, is not installed"""
+    if np is None:
+        raise ImportError(
+            f"{feature} requires NumPy; install it with "
+            "'pip install aerotrace-parsers[numpy]'"
+        )
+
+
+def is_missing(value: Optional[float]) -> bool:
+    """Check whether a reading is missing
+
+    Float readings use NaN as the missing marker; integer readings such as
+    RPM use None.
+    """
+    return value is None or math.isnan(value)
+
+
+def _missing_to_none(data: dict) -> dict:
+    """Replace NaN readings in a nested dictionary with None"""
+    for key, value in data.items():
+        if isinstance(value, dict):
+            _missing_to_none(value)
+        elif _is_nan(value):
+            data[key] = None
+    return data
+
+
+def _nan_aware_eq(self, other: object) -> bool:
+    """Dataclass equality that treats two missing (NaN) readings as equal"""
+    if other.__class__ is not self.__class__:
+        return NotImplemented
+
+    for f in fields(self):
+        mine, theirs = getattr(self, f.name), getattr(other, f.name)
+        if mine != theirs and not (_is_nan(mine) and _is_nan(theirs)):
+            return False
+    return True
+
+
+# NumPy float scalars other than float64 (e.g. float32) do not subclass float
+_FLOAT_TYPES = (float,) if np is None else (float, np.floating)
+
+
+def _is_nan(value: object) -> bool:
+    """Check whether a field value is a NaN float (including NumPy floats)"""
+    return isinstance(value, _FLOAT_TYPES) and math.isnan(value)
 
 
 @dataclass
 class Cylinder:
     """Temperature reading for a specific cylinder (EGT or CHT)"""
 
+    # Declared by hand rather than via dataclass(slots=True), which needs 3.10+
+    __slots__ = ("number", "value")
+
     number: int  # Cylinder number (1-based)
     value: float  # Temperature in degrees Fahrenheit
 
@@ -19,52 +146,503 @@ class Cylinder:
         if not isinstance(self.value, (int, float)):
             raise ValueError("Temperature value must be numeric")
 
+    @classmethod
+    def unchecked(cls, number: int, value: float) -> Cylinder:
+        """Create a reading without validation
 
-class Cylinders:
-    """Collection of cylinder temperature readings with utility methods"""
+        For trusted callers, such as parsers and Cylinders, that already hold
+        a cylinder number >= 1 and a float temperature.
+        """
+        cyl = object.__new__(cls)
+        cyl.number = number
+        cyl.value = value
+        return cyl
 
-    def __init__(self, readings: List[Cylinder]) -> None:
-        self._readings = readings
 
-    def __iter__(self):
-        return iter(self._readings)
+class Cylinders:
+    """Collection of cylinder temperature readings with utility methods
+
+    Readings are stored as two parallel NumPy arrays (cylinder numbers and
+    temperature values) rather than a list of ``Cylinder`` objects, so that
+    reductions run in C. ``Cylinder`` objects are rebuilt on demand. Without
+    NumPy, stdlib ``array.array`` is used for the same layout.
+
+    Building or iterating a short row costs more than a plain list would
+    (microseconds rather than hundreds of nanoseconds for six readings), since
+    values cross into NumPy and readings are recreated on the way out. Prefer
+    the array exports, reductions and EngineDataFrame for bulk work.
+    """
+
+    def __init__(self, readings: Sequence[Cylinder]) -> None:
+        self._set_lists(
+            [cyl.number for cyl in readings], [cyl.value for cyl in readings]
+        )
+
+    def _set_lists(self, numbers: Sequence[int], values: Sequence[float]) -> None:
+        """Attach storage built from plain sequences of numbers and values"""
+        if np is None:
+            self._set_storage(array("i", numbers), array("d", values))
+        else:
+            self._set_storage(
+                np.array(numbers, dtype=np.int32), np.array(values, dtype=np.float64)
+            )
+
+    def _set_storage(self, numbers, values) -> None:
+        """Attach the cylinder number and temperature arrays
+
+        NumPy storage is marked read-only, so NumPy refuses to make any view
+        handed out by to_numpy writeable again.
+        """
+        if np is not None:
+            numbers.setflags(write=False)
+            values.setflags(write=False)
+        self._numbers = numbers
+        self._values = values
+        self._reduced: Optional[Tuple[int, int]] = None
+
+    @classmethod
+    def from_arrays(cls, numbers, values) -> Cylinders:
+        """Build readings directly from cylinder number and temperature arrays
+
+        Avoids constructing a Cylinder per reading. Contiguous int32/float64
+        arrays backed by an immutable buffer (e.g. ``np.frombuffer`` over
+        ``bytes``) are shared without copying; anything else is copied so
+        later changes by the caller cannot alter the readings. Without NumPy, any
+        sequences are accepted and copied into ``array.array``.
+
+        Args:
+            numbers: 1-D array-like of cylinder numbers (1-based)
+            values: 1-D array-like of temperatures, same length as numbers
+
+        Returns:
+            Cylinders backed by the given arrays
+
+        Raises:
+            ValueError: If the arrays are not 1-D, differ in length, or any
+                cylinder number is not an integer, is < 1 or does not fit in
+                int32
+        """
+        if np is None:
+            numbers = list(numbers)
+            if not all(_is_whole_number(number) for number in numbers):
+                raise ValueError("Cylinder number must be an integer")
+            try:
+                numbers = array("i", map(int, numbers))
+            except OverflowError:
+                raise ValueError("Cylinder number must fit in int32") from None
+            values = array("d", values)
+
+            if len(numbers) != len(values):
+                raise ValueError(
+                    "Cylinder number and value arrays must be the same length"
+                )
+            if numbers and min(numbers) < 1:
+                raise ValueError("Cylinder number must be >= 1")
+        else:
+            numbers = np.asarray(numbers)
+            values = np.asarray(values)
+
+            if numbers.ndim != 1 or values.ndim != 1:
+                raise ValueError("Cylinder arrays must be one-dimensional")
+            if numbers.shape != values.shape:
+                raise ValueError(
+                    "Cylinder number and value arrays must be the same length"
+                )
+            # Checked before the int32 cast, which would silently truncate
+            # fractions and wrap NaN or out-of-range numbers
+            if numbers.dtype.kind not in "iu" and not (
+                numbers.dtype.kind == "f" and np.array_equal(numbers, np.trunc(numbers))
+            ):
+                raise ValueError("Cylinder number must be an integer")
+            if numbers.size and numbers.min() < 1:
+                raise ValueError("Cylinder number must be >= 1")
+            if numbers.size and numbers.max() > _INT32_MAX:
+                raise ValueError("Cylinder number must fit in int32")
+
+            numbers = _owned_array(numbers, np.int32)
+            values = _owned_array(values, np.float64)
+
+        readings = cls.__new__(cls)
+        readings._set_storage(numbers, values)
+        return readings
+
+    @classmethod
+    def _from_lists(
+        cls, numbers: Optional[List[int]], values: List[float]
+    ) -> Cylinders:
+        """Build readings from plain lists a trusted caller has already checked
+
+        For parsers that collect cylinder numbers (>= 1) and float temperatures
+        themselves, skipping per-reading Cylinder objects and the validation
+        in from_arrays. Passing None for numbers means cylinders 1 to
+        len(values), which reuses one shared array.
+        """
+        readings = cls.__new__(cls)
+        if numbers is not None:
+            readings._set_lists(numbers, values)
+        elif np is None:
+            readings._set_lists(range(1, len(values) + 1), values)
+        else:
+            readings._set_storage(
+                _sequential_numbers(len(values)), np.array(values, dtype=np.float64)
+            )
+        return readings
+
+    @classmethod
+    def from_buffer(
+        cls, buffer, dtype: np.dtype = CYLINDER_DTYPE, count: int = -1
+    ) -> Cylinders:
+        """Build readings from packed (number, value) records in a bytes-like buffer
+
+        Args:
+            buffer: Object exposing the buffer interface (bytes, memoryview, ...)
+            dtype: Structured record dtype with ``number`` and ``value`` fields
+            count: Number of records to read, or -1 for the whole buffer
+
+        Returns:
+            Cylinders holding a contiguous copy of each field
+
+        Raises:
+            ImportError: If NumPy is not installed
+        """
+        _require_numpy("Cylinders.from_buffer")
+        records = np.frombuffer(buffer, dtype=dtype, count=count)
+        return cls.from_arrays(records["number"], records["value"])
+
+    def _cylinder(self, index: int) -> Cylinder:
+        """Build the Cylinder stored at the given position"""
+        return Cylinder.unchecked(int(self._numbers[index]), float(self._values[index]))
+
+    def __iter__(self) -> Iterator[Cylinder]:
+        # Cylinder.unchecked inlined; the call overhead dominates for short rows
+        new = object.__new__
+        for number, value in zip(self._numbers.tolist(), self._values.tolist()):
+            cyl = new(Cylinder)
+            cyl.number = number
+            cyl.value = value
+            yield cyl
+
+    def iter_reused(self) -> Iterator[Cylinder]:
+        """Iterate over readings through a single reused Cylinder
+
+        The same object is updated in place and yielded at every step, so a
+        reading is only valid until the next one is produced. Suited to scans
+        that read each value once; use plain iteration to keep readings.
+        """
+        cyl = object.__new__(Cylinder)
+        for number, value in zip(self._numbers.tolist(), self._values.tolist()):
+            cyl.number = number
+            cyl.value = value
+            yield cyl
 
     def __len__(self) -> int:
-        return len(self._readings)
+        return len(self._values)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Cylinders):
+            return NotImplemented
+        # Missing (NaN) readings compare equal, as on the other engine models
+        if np is None:
+            return self._numbers == other._numbers and _values_equal(
+                self._values, other._values
+            )
+
+        return np.array_equal(self._numbers, other._numbers) and np.array_equal(
+            self._values, other._values, equal_nan=True
+        )
+
+    def __hash__(self) -> int:
+        # Storage is read-only and never shares memory a caller can write, so
+        # content hashing is stable. Values are hashed in canonical form so
+        # that equal readings (0.0 and -0.0, any two NaNs) hash alike.
+        return hash((self._numbers.tobytes(), _canonical_bytes(self._values)))
 
     def __getitem__(self, index):
-        return self._readings[index]
+        if isinstance(index, slice):
+            return [self._cylinder(i) for i in range(*index.indices(len(self)))]
+        return self._cylinder(index)
 
     def to_dict(self) -> List[dict]:
         """Convert cylinder readings to a list of dictionaries"""
-        return [asdict(cyl) for cyl in self._readings]
+        return [
+            {"number": number, "value": value}
+            for number, value in zip(self._numbers.tolist(), self._values.tolist())
+        ]
+
+    def to_numpy(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Get the cylinder numbers and temperatures as NumPy arrays
+
+        Returns read-only views of the underlying storage, so no data is copied.
+
+        Returns:
+            Tuple of (numbers, values) arrays, int32 and float64
+
+        Raises:
+            ImportError: If NumPy is not installed
+        """
+        _require_numpy("Cylinders.to_numpy")
+        return self._numbers.view(), self._values.view()
+
+    def to_arrow(self):
+        """Convert cylinder readings to a PyArrow struct array
+
+        Numeric buffers are shared with PyArrow rather than copied where the
+        storage allows it.
+
+        Returns:
+            pyarrow.StructArray with ``number`` (int32) and ``value`` (float64) fields
+
+        Raises:
+            ImportError: If PyArrow is not installed
+        """
+        try:
+            import pyarrow as pa
+        except ImportError as e:
+            raise ImportError(
+                "Cylinders.to_arrow requires PyArrow; install it with "
+                "'pip install aerotrace-parsers[arrow]'"
+            ) from e
+
+        return pa.StructArray.from_arrays(
+            [
+                pa.array(self._numbers, type=pa.int32()),
+                pa.array(self._values, type=pa.float64()),
+            ],
+            names=["number", "value"],
+        )
+
+    def _reduce(self) -> Optional[Tuple[int, int]]:
+        """Get the (coolest, hottest) reading positions, computed once and cached
+
+        Readings never change after construction, so the reduction is only
+        done on first use and shared by the hottest/coolest/difference queries.
+        """
+        if self._reduced is None and len(self._values):
+            self._reduced = self._minmax()
+
+        return self._reduced
+
+    def _minmax(self) -> Optional[Tuple[int, int]]:
+        """Find the (coolest, hottest) positions, skipping NaN readings
+
+        Ties resolve to the first occurrence; returns None if every reading is
+        NaN. NumPy storage uses the compiled kernel for small arrays when Numba
+        is installed and argmin/argmax otherwise; the array.array fallback
+        uses _minmax_loop.
+        """
+        if np is None:
+            return _minmax_loop(self._values)
+
+        if _minmax_kernel is not None and len(self._values) <= _KERNEL_MAX_READINGS:
+            lo_index, hi_index = _minmax_kernel(self._values)
+            return (lo_index, hi_index) if hi_index >= 0 else None
+
+        values = self._values
+        lo_index, hi_index = int(values.argmin()), int(values.argmax())
+        if not math.isnan(values[hi_index]):
+            return lo_index, hi_index
+
+        # argmin/argmax report the first NaN; search only the present readings
+        present = np.flatnonzero(~np.isnan(values))
+        if not present.size:
+            return None
+
+        kept = values[present]
+        return int(present[kept.argmin()]), int(present[kept.argmax()])
 
     def get_hottest(self) -> Optional[Cylinder]:
         """Get the cylinder with the highest temperature reading"""
-        if not self._readings:
+        reduced = self._reduce()
+        if reduced is None:
             return None
 
-        return max(self._readings, key=lambda x: x.value)
+        return self._cylinder(reduced[1])
 
     def get_coolest(self) -> Optional[Cylinder]:
         """Get the cylinder with the lowest temperature reading"""
-        if not self._readings:
+        reduced = self._reduce()
+        if reduced is None:
             return None
 
-        return min(self._readings, key=lambda x: x.value)
+        return self._cylinder(reduced[0])
 
     def get_difference(self) -> Optional[float]:
         """Get the temperature difference between hottest and coolest cylinders"""
-        hottest = self.get_hottest()
-        coolest = self.get_coolest()
+        reduced = self._reduce()
+        if reduced is None:
+            return None
 
-        if hottest and coolest:
-            return hottest.value - coolest.value
+        coolest, hottest = reduced
+        return float(self._values[hottest] - self._values[coolest])
 
-        return None
 
+_SEQUENTIAL_NUMBERS: Dict[int, np.ndarray] = {}
 
-@dataclass
+
+def _sequential_numbers(count: int) -> np.ndarray:
+    """Get the read-only cylinder numbers 1 to count, shared between readings"""
+    numbers = _SEQUENTIAL_NUMBERS.get(count)
+    if numbers is None:
+        numbers = np.arange(1, count + 1, dtype=np.int32)
+        numbers.setflags(write=False)
+        _SEQUENTIAL_NUMBERS[count] = numbers
+    return numbers
+
+
+def _is_whole_number(number: object) -> bool:
+    """Check that a cylinder number is an int or a float with no fraction"""
+    if isinstance(number, float):
+        return number.is_integer()
+    return isinstance(number, int)
+
+
+def _values_equal(first: Iterable[float], second: Iterable[float]) -> bool:
+    """Compare array.array temperatures, treating two NaN readings as equal"""
+    first, second = list(first), list(second)
+    return len(first) == len(second) and all(
+        a == b or (a != a and b != b) for a, b in zip(first, second)
+    )
+
+
+def _canonical_bytes(values) -> bytes:
+    """Get the bytes of temperatures with zeros as +0.0 and one NaN pattern"""
+    if np is None:
+        return array(
+            "d", (math.nan if value != value else value + 0.0 for value in values)
+        ).tobytes()
+
+    canonical = values + 0.0  # -0.0 + 0.0 is +0.0
+    canonical[np.isnan(canonical)] = math.nan
+    return canonical.tobytes()
+
+
+def _minmax_loop(values: Iterable[float]) -> Optional[Tuple[int, int]]:
+    """Find the (coolest, hottest) positions in one pure-Python pass
+
+    Used for array.array storage when NumPy is not installed. Tracks both
+    extremes together, so each value is loaded once and needs at most two
+    comparisons. NaN readings are skipped and ties resolve to the first
+    occurrence; returns None if no reading is present.
+    """
+    lo = hi = 0.0
+    lo_index = hi_index = -1
+
+    for index, value in enumerate(values):
+        if value != value:  # NaN
+            continue
+        if hi_index < 0:
+            lo = hi = value
+            lo_index = hi_index = index
+        elif value > hi:
+            hi, hi_index = value, index
+        elif value < lo:
+            lo, lo_index = value, index
+
+    return (lo_index, hi_index) if hi_index >= 0 else None
+
+
+# Shared by every EngineData created without EGT/CHT readings
+_EMPTY_CYLINDERS = Cylinders([])
+
+
+class _FixedCylinders(Cylinders):
+    """Base for Cylinders subclasses generated for a fixed cylinder count"""
+
+    cylinder_count: int
+
+    def _set_storage(self, numbers, values) -> None:
+        if len(values) != self.cylinder_count:
+            raise ValueError(
+                f"{type(self).__name__} requires exactly "
+                f"{self.cylinder_count} readings, got {len(values)}"
+            )
+        super()._set_storage(numbers, values)
+
+    def __reduce__(self):
+        return _rebuild_fixed_cylinders, (
+            self.cylinder_count,
+            self._numbers,
+            self._values,
+        )
+
+
+def _rebuild_fixed_cylinders(count: int, numbers, values) -> Cylinders:
+    """Unpickle a generated fixed-count Cylinders"""
+    return make_cylinders_class(count).from_arrays(numbers, values)
+
+
+def _minmax_source(count: int) -> str:
+    """Generate source for a _minmax unrolled over exactly count values"""
+    names = [f"v{index}" for index in range(count)]
+    # The generic path owns the kernel choice and NaN handling
+    lines = [
+        "def _minmax(self):",
+        "    if _minmax_kernel is not None and np is not None:",
+        "        return Cylinders._minmax(self)",
+        f"    {', '.join(names)}, = self._values.tolist()",
+        f"    if {' or '.join(f'{name} != {name}' for name in names)}:",
+        "        return Cylinders._minmax(self)",
+        "    lo = hi = v0",
+        "    lo_index = hi_index = 0",
+    ]
+    for index, name in enumerate(names[1:], start=1):
+        lines += [
+            f"    if {name} > hi:",
+            f"        hi, hi_index = {name}, {index}",
+            f"    elif {name} < lo:",
+            f"        lo, lo_index = {name}, {index}",
+        ]
+    lines.append("    return lo_index, hi_index")
+    return "\n".join(lines) + "\n"
+
+
+_CYLINDERS_CLASSES: Dict[int, Type[Cylinders]] = {}
+
+
+def make_cylinders_class(count: int) -> Type[Cylinders]:
+    """Get a Cylinders subclass specialised for exactly count readings
+
+    The subclass's hottest/coolest search is generated with the loop fully
+    unrolled for that count. Classes are generated once and cached, so
+    calling this per row is cheap. The Numba kernel is still preferred when
+    it is available, and rows with NaN readings take the generic path.
+
+    Args:
+        count: Number of readings every instance holds, e.g. 6 for a six
+            cylinder engine with all probes reporting
+
+    Returns:
+        Cylinders subclass whose instances must hold exactly count readings
+
+    Raises:
+        ValueError: If count is < 1
+    """
+    cls = _CYLINDERS_CLASSES.get(count)
+    if cls is not None:
+        return cls
+
+    if count < 1:
+        raise ValueError("Cylinder count must be >= 1")
+
+    namespace: dict = {}
+    # Source is generated from count alone, never from caller-supplied text
+    exec(_minmax_source(count), globals(), namespace)  # noqa: S102
+
+    cls = type(
+        f"Cylinders{count}",
+        (_FixedCylinders,),
+        {
+            "__doc__": f"Cylinders specialised for exactly {count} readings",
+            "__module__": __name__,
+            "cylinder_count": count,
+            "_minmax": namespace["_minmax"],
+        },
+    )
+    _CYLINDERS_CLASSES[count] = cls
+    return cls
+
+
+@dataclass(**_SLOTS)
 class RPM:
     """Engine RPM data with dual magneto support"""
 
@@ -80,61 +658,344 @@ class RPM:
         return None
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class Fuel:
     """Fuel system data with pressure, flow, quantity and alerts"""
 
-    pressure: Optional[float] = None  # PSI
-    flow: Optional[float] = None  # LPH
-    quantity: Optional[float] = None  # L
+    pressure: float = math.nan  # PSI
+    flow: float = math.nan  # LPH
+    quantity: float = math.nan  # L
     pressure_alert: bool = False
     quantity_alert: bool = False
 
+    __eq__ = _nan_aware_eq
+
     @property
     def has_active_alert(self) -> bool:
         """Check if any fuel system alerts are active"""
         return self.pressure_alert or self.quantity_alert
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class Oil:
     """Oil system data with pressure, temperature and alerts"""
 
-    pressure: Optional[float] = None  # PSI
-    temperature: Optional[float] = None  # Fahrenheit
+    pressure: float = math.nan  # PSI
+    temperature: float = math.nan  # Fahrenheit
     pressure_alert: bool = False
     temperature_alert: bool = False
 
+    __eq__ = _nan_aware_eq
+
     @property
     def has_active_alert(self) -> bool:
         """Check if any oil system alerts are active"""
         return self.pressure_alert or self.temperature_alert
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class Electrical:
     """Electrical system data"""
 
-    volts: Optional[float] = None  # V
-    amps: Optional[float] = None  # A
+    volts: float = math.nan  # V
+    amps: float = math.nan  # A
 
+    __eq__ = _nan_aware_eq
 
-@dataclass
+
+@dataclass(**_SLOTS)
 class EngineData:
     """Standardized engine data format for all EMS types"""
 
     rpm: RPM = field(default_factory=RPM)
-    manifold_pressure: Optional[float] = None
-    egts: Cylinders = field(default_factory=lambda: Cylinders([]))
-    chts: Cylinders = field(default_factory=lambda: Cylinders([]))
+    manifold_pressure: float = math.nan
+    egts: Cylinders = _EMPTY_CYLINDERS
+    chts: Cylinders = _EMPTY_CYLINDERS
     fuel: Fuel = field(default_factory=Fuel)
     oil: Oil = field(default_factory=Oil)
     electrical: Electrical = field(default_factory=Electrical)
-    g_force: Optional[float] = None
+    g_force: float = math.nan
+
+    __eq__ = _nan_aware_eq
 
     def to_dict(self) -> dict:
-        """Convert EngineData to a dictionary"""
-        base_dict = asdict(self)
+        """Convert EngineData to a dictionary, reporting missing readings as None"""
+        base_dict = _missing_to_none(asdict(self))
         base_dict["egts"] = self.egts.to_dict()
         base_dict["chts"] = self.chts.to_dict()
         return base_dict
+
+
+# EngineDataFrame column name -> EngineData attribute path
+_FLOAT_COLUMNS = {
+    "rpm_left": "rpm.left",
+    "rpm_right": "rpm.right",
+    "rpm_computed": "rpm.computed",
+    "manifold_pressure": "manifold_pressure",
+    "fuel_pressure": "fuel.pressure",
+    "fuel_flow": "fuel.flow",
+    "fuel_quantity": "fuel.quantity",
+    "oil_pressure": "oil.pressure",
+    "oil_temperature": "oil.temperature",
+    "volts": "electrical.volts",
+    "amps": "electrical.amps",
+    "g_force": "g_force",
+}
+_BOOL_COLUMNS = {
+    "fuel_pressure_alert": "fuel.pressure_alert",
+    "fuel_quantity_alert": "fuel.quantity_alert",
+    "oil_pressure_alert": "oil.pressure_alert",
+    "oil_temperature_alert": "oil.temperature_alert",
+}
+_CYLINDER_COLUMNS = ("egts", "chts")
+
+# Fixed number of EGT/CHT slots per record in the ENGINE_DATA_DTYPE file layout
+MAX_CYLINDERS = 8
+
+
+def _int_or_none(value: float) -> Optional[int]:
+    """Convert a NaN column value back to None, otherwise to int"""
+    return None if np.isnan(value) else int(value)
+
+
+def _cylinders_from_row(row: np.ndarray) -> Cylinders:
+    """Build Cylinders from one frame row, where column j holds cylinder j + 1"""
+    present = ~np.isnan(row)
+    if not present.any():
+        return _EMPTY_CYLINDERS
+
+    return Cylinders.from_arrays(np.flatnonzero(present) + 1, row[present])
+
+
+def _cylinder_matrix(readings: Sequence[Cylinders]) -> np.ndarray:
+    """Stack per-sample Cylinders into an (N, cylinders) array padded with NaN
+
+    Raises:
+        ValueError: If a sample holds more than one reading for a cylinder
+    """
+    count = max((int(cyl._numbers.max()) for cyl in readings if len(cyl)), default=0)
+    matrix = np.full((len(readings), count), np.nan)
+
+    for row, cyl in enumerate(readings):
+        # Each cylinder has one column, so a repeated number would overwrite
+        if len(set(cyl._numbers.tolist())) != len(cyl):
+            raise ValueError(f"Duplicate cylinder number in sample {row}")
+        matrix[row, cyl._numbers - 1] = cyl._values
+
+    return matrix
+
+
+@dataclass(eq=False)
+class EngineDataFrame:
+    """Columnar batch of EngineData samples
+
+    Each scalar field is held as one array with an entry per sample, and
+    missing values are NaN (including RPM, which is None on EngineData). EGT
+    and CHT readings are (samples, cylinders) arrays where column j holds
+    cylinder j + 1. Aggregates over a flight are single NumPy calls, e.g.
+    ``np.nanmax(frame.chts, axis=1)``.
+    """
+
+    rpm_left: np.ndarray
+    rpm_right: np.ndarray
+    rpm_computed: np.ndarray
+    manifold_pressure: np.ndarray
+    egts: np.ndarray
+    chts: np.ndarray
+    fuel_pressure: np.ndarray
+    fuel_flow: np.ndarray
+    fuel_quantity: np.ndarray
+    fuel_pressure_alert: np.ndarray
+    fuel_quantity_alert: np.ndarray
+    oil_pressure: np.ndarray
+    oil_temperature: np.ndarray
+    oil_pressure_alert: np.ndarray
+    oil_temperature_alert: np.ndarray
+    volts: np.ndarray
+    amps: np.ndarray
+    g_force: np.ndarray
+
+    def __post_init__(self) -> None:
+        _require_numpy("EngineDataFrame")
+
+        for name in _FLOAT_COLUMNS:
+            setattr(self, name, np.asarray(getattr(self, name), dtype=np.float64))
+        for name in _BOOL_COLUMNS:
+            setattr(self, name, np.asarray(getattr(self, name), dtype=np.bool_))
+        for name in _CYLINDER_COLUMNS:
+            matrix = np.asarray(getattr(self, name), dtype=np.float64)
+            if matrix.ndim != 2:
+                raise ValueError(f"{name} must be a (samples, cylinders) array")
+            setattr(self, name, matrix)
+
+        lengths = {len(getattr(self, f.name)) for f in fields(self)}
+        if len(lengths) > 1:
+            raise ValueError("All columns must have the same number of samples")
+
+    @classmethod
+    def from_engine_data(cls, samples: Iterable[EngineData]) -> EngineDataFrame:
+        """Build a frame from EngineData samples
+
+        Args:
+            samples: EngineData objects, e.g. the output of a parser's parse_file
+
+        Returns:
+            EngineDataFrame with one row per sample
+
+        Raises:
+            ImportError: If NumPy is not installed
+            ValueError: If a sample's EGT or CHT readings repeat a cylinder
+        """
+        _require_numpy("EngineDataFrame")
+        samples = list(samples)
+        columns = {}
+
+        for name, path in _FLOAT_COLUMNS.items():
+            get = attrgetter(path)
+            columns[name] = np.array([get(s) for s in samples], dtype=np.float64)
+        for name, path in _BOOL_COLUMNS.items():
+            get = attrgetter(path)
+            columns[name] = np.array([get(s) for s in samples], dtype=np.bool_)
+        for name in _CYLINDER_COLUMNS:
+            columns[name] = _cylinder_matrix([getattr(s, name) for s in samples])
+
+        return cls(**columns)
+
+    @classmethod
+    def from_records(cls, records: np.ndarray) -> EngineDataFrame:
+        """Build a frame from an ENGINE_DATA_DTYPE record array
+
+        Each field is copied out into its own contiguous column; cylinder slots
+        that are empty in every record are dropped.
+
+        Args:
+            records: Structured array with dtype ENGINE_DATA_DTYPE
+
+        Returns:
+            EngineDataFrame with one row per record
+        """
+        columns = {name: records[name].copy() for name in records.dtype.names}
+
+        for name in _CYLINDER_COLUMNS:
+            present = np.flatnonzero(~np.isnan(columns[name]).all(axis=0))
+            count = int(present[-1]) + 1 if present.size else 0
+            columns[name] = np.ascontiguousarray(columns[name][:, :count])
+
+        return cls(**columns)
+
+    @classmethod
+    def from_file(cls, file_path: Union[str, Path]) -> EngineDataFrame:
+        """Load a frame written by to_file
+
+        Args:
+            file_path: Path to a file of packed ENGINE_DATA_DTYPE records
+
+        Returns:
+            EngineDataFrame with one row per record
+
+        Raises:
+            FileNotFoundError: If the specified file doesn't exist
+            ImportError: If NumPy is not installed
+        """
+        _require_numpy("EngineDataFrame")
+        path = Path(file_path)
+        if not path.exists():
+            raise FileNotFoundError(f"File not found: {file_path}")
+
+        return cls.from_records(np.fromfile(path, dtype=ENGINE_DATA_DTYPE))
+
+    def to_records(self) -> np.ndarray:
+        """Pack the frame into an ENGINE_DATA_DTYPE record array
+
+        Returns:
+            Structured array with one record per sample, unused cylinder slots NaN
+
+        Raises:
+            ValueError: If the frame holds more than MAX_CYLINDERS cylinders
+        """
+        records = np.zeros(len(self), dtype=ENGINE_DATA_DTYPE)
+
+        for f in fields(self):
+            column = getattr(self, f.name)
+            if f.name in _CYLINDER_COLUMNS:
+                if column.shape[1] > MAX_CYLINDERS:
+                    raise ValueError(
+                        f"{f.name} has {column.shape[1]} cylinders; "
+                        f"records hold at most {MAX_CYLINDERS}"
+                    )
+                records[f.name] = np.nan
+                records[f.name][:, : column.shape[1]] = column
+            else:
+                records[f.name] = column
+
+        return records
+
+    def to_file(self, file_path: Union[str, Path]) -> None:
+        """Write the frame as packed ENGINE_DATA_DTYPE records
+
+        Args:
+            file_path: Destination path, overwritten if it exists
+        """
+        self.to_records().tofile(file_path)
+
+    def __len__(self) -> int:
+        return len(self.rpm_left)
+
+    def __iter__(self) -> Iterator[EngineData]:
+        for index in range(len(self)):
+            yield self[index]
+
+    def __getitem__(self, index: int) -> EngineData:
+        """Materialize the sample at the given row as an EngineData"""
+        if not isinstance(index, (int, np.integer)):
+            raise TypeError(
+                f"EngineDataFrame indices must be integers, not {type(index).__name__}"
+            )
+
+        return EngineData(
+            rpm=RPM(
+                left=_int_or_none(self.rpm_left[index]),
+                right=_int_or_none(self.rpm_right[index]),
+                computed=_int_or_none(self.rpm_computed[index]),
+            ),
+            manifold_pressure=float(self.manifold_pressure[index]),
+            egts=_cylinders_from_row(self.egts[index]),
+            chts=_cylinders_from_row(self.chts[index]),
+            fuel=Fuel(
+                pressure=float(self.fuel_pressure[index]),
+                flow=float(self.fuel_flow[index]),
+                quantity=float(self.fuel_quantity[index]),
+                pressure_alert=bool(self.fuel_pressure_alert[index]),
+                quantity_alert=bool(self.fuel_quantity_alert[index]),
+            ),
+            oil=Oil(
+                pressure=float(self.oil_pressure[index]),
+                temperature=float(self.oil_temperature[index]),
+                pressure_alert=bool(self.oil_pressure_alert[index]),
+                temperature_alert=bool(self.oil_temperature_alert[index]),
+            ),
+            electrical=Electrical(
+                volts=float(self.volts[index]),
+                amps=float(self.amps[index]),
+            ),
+            g_force=float(self.g_force[index]),
+        )
+
+
+def _engine_data_dtype() -> np.dtype:
+    """Build the packed record dtype mirroring EngineDataFrame's columns"""
+    layout = []
+    for f in fields(EngineDataFrame):
+        if f.name in _BOOL_COLUMNS:
+            layout.append((f.name, "?"))
+        elif f.name in _CYLINDER_COLUMNS:
+            layout.append((f.name, "<f8", (MAX_CYLINDERS,)))
+        else:
+            layout.append((f.name, "<f8"))
+    return np.dtype(layout)
+
+
+# Packed on-disk/on-wire record layout for one EngineData sample, used by
+# EngineDataFrame.from_file and to_file. For I/O only: frames keep one
+# contiguous array per column for computation.
+ENGINE_DATA_DTYPE = _engine_data_dtype() if np is not None else None
@@ -22,6 +22,7 @@ Example usage:
 
 import csv
 import logging
+import math
 import re
 from pathlib import Path
 from typing import Dict, Iterator, Optional, Union
@@ -38,7 +39,7 @@ logger = logging.getLogger(__name__)
 __all__ = ["parse_file", "parse_csv_row"]
 
 
-def _get_float(data: Dict[str, str], key: str) -> Optional[float]:
+def _get_float(data: Dict[str, str], key: str) -> float:
     """Extract and convert parameter to float from data dictionary
 
     Args:
@@ -46,16 +47,16 @@ def _get_float(data: Dict[str, str], key: str) -> Optional[float]:
         key: Column name to extract
 
     Returns:
-        Float value or None if conversion fails or value is empty
+        Float value or NaN if conversion fails or value is empty
     """
     value = data.get(key, "").strip()
     if not value:
-        return None
+        return math.nan
 
     try:
         return float(value)
     except ValueError:
-        return None
+        return math.nan
 
 
 def _get_int(data: Dict[str, str], key: str) -> Optional[int]:
@@ -78,7 +79,7 @@ def _get_int(data: Dict[str, str], key: str) -> Optional[int]:
         return None
 
 
-def _parse_tank_quantity(data: Dict[str, str], key: str) -> Optional[float]:
+def _parse_tank_quantity(data: Dict[str, str], key: str) -> float:
     """Parse fuel tank quantity from CGR-30P format
 
     The CGR-30P exports tank quantity in format "TOTAL   : 68.16". This function
@@ -89,17 +90,17 @@ def _parse_tank_quantity(data: Dict[str, str], key: str) -> Optional[float]:
         key: Column name to extract (typically 'SEL TANK QTY')
 
     Returns:
-        Numeric fuel quantity in liters, or None if parsing fails
+        Numeric fuel quantity in liters, or NaN if parsing fails
     """
     tank_qty_str = data.get(key, "").strip()
     if not tank_qty_str:
-        return None
+        return math.nan
 
     match = re.search(r":\s*(\d+(?:\.\d+)?)", tank_qty_str)
     if match:
         return float(match.group(1))
 
-    return None
+    return math.nan
 
 
 def _parse_cylinders(
@@ -113,17 +114,24 @@ def _parse_cylinders(
         count: Number of cylinders to parse (default 6)
 
     Returns:
-        Cylinders object containing all valid temperature readings
+        Cylinders object containing all valid temperature readings, specialised
+        for the cylinder count when every cylinder reported
     """
-    readings = []
+    numbers = []
+    values = []
 
     for i in range(1, count + 1):
         temp_value = _get_float(data, f"{prefix}{i};*F")
 
-        if temp_value is not None:
-            readings.append(engine.Cylinder(number=i, value=temp_value))
+        if not engine.is_missing(temp_value):
+            numbers.append(i)
+            values.append(temp_value)
+
+    # Cylinders are numbered 1 to count when every one reported
+    if len(values) == count:
+        return engine.make_cylinders_class(count)._from_lists(None, values)
 
-    return engine.Cylinders(readings)
+    return engine.Cylinders._from_lists(numbers, values)
 
 
 def parse_csv_row(data: Dict[str, str]) -> engine.EngineData:
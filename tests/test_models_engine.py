@@ -2,8 +2,45 @@
 Tests for aerotrace.models.engine module.
 """
 
+import math
+import pickle
+import sys
+from array import array
+
+import numpy as np
 import pytest
-from aerotrace.models import Cylinder, Cylinders, RPM, Fuel, Oil, Electrical, EngineData
+from aerotrace.models import engine
+from aerotrace.models import (
+    CYLINDER_DTYPE,
+    ENGINE_DATA_DTYPE,
+    MAX_CYLINDERS,
+    Cylinder,
+    Cylinders,
+    RPM,
+    Fuel,
+    Oil,
+    Electrical,
+    EngineData,
+    EngineDataFrame,
+    is_missing,
+    make_cylinders_class,
+)
+
+
+class TestIsMissing:
+    """Test cases for the is_missing helper."""
+
+    def test_missing_values(self):
+        """Test that NaN and None are reported as missing."""
+        assert is_missing(math.nan)
+        assert is_missing(float("nan"))
+        assert is_missing(None)
+
+    def test_present_values(self):
+        """Test that real readings, including zero, are not missing."""
+        assert not is_missing(0.0)
+        assert not is_missing(24.5)
+        assert not is_missing(2400)
 
 
 class TestCylinder:
@@ -15,6 +52,14 @@ class TestCylinder:
         assert reading.number == 1
         assert reading.value == 1200.5
 
+    def test_cylinder_has_no_instance_dict(self):
+        """Test that readings use slots instead of a per-instance dict."""
+        reading = Cylinder(number=1, value=1200.0)
+        assert not hasattr(reading, "__dict__")
+
+        with pytest.raises(AttributeError):
+            reading.unknown = 1  # type: ignore
+
     def test_cylinder_number_validation(self):
         """Test validation of cylinder number."""
         Cylinder(number=1, value=1200.0)
@@ -39,6 +84,12 @@ class TestCylinder:
         with pytest.raises(ValueError, match="Temperature value must be numeric"):
             Cylinder(number=1, value=None)  # type: ignore
 
+    def test_unchecked(self):
+        """Test creating a reading without validation."""
+        reading = Cylinder.unchecked(2, 1250.5)
+        assert reading == Cylinder(number=2, value=1250.5)
+        assert isinstance(reading, Cylinder)
+
 
 class TestCylinders:
     """Test cases for the Cylinders collection class."""
@@ -109,6 +160,69 @@ class TestCylinders:
         difference = readings.get_difference()
         assert difference == 70.5
 
+    def test_repeated_queries(self):
+        """Test that repeated reductions return consistent results."""
+        readings = Cylinders(
+            [
+                Cylinder(number=1, value=1200.0),
+                Cylinder(number=2, value=1250.5),
+                Cylinder(number=3, value=1180.0),
+            ]
+        )
+
+        assert readings.get_difference() == 70.5
+        assert readings.get_hottest() == Cylinder(number=2, value=1250.5)
+        assert readings.get_coolest() == Cylinder(number=3, value=1180.0)
+        assert readings.get_difference() == 70.5
+
+    def test_ties_resolve_to_first_reading(self):
+        """Test that tied extremes report the first matching cylinder."""
+        readings = Cylinders(
+            [
+                Cylinder(number=1, value=1180.0),
+                Cylinder(number=2, value=1250.0),
+                Cylinder(number=3, value=1250.0),
+                Cylinder(number=4, value=1180.0),
+            ]
+        )
+
+        assert readings.get_hottest() == Cylinder(number=2, value=1250.0)
+        assert readings.get_coolest() == Cylinder(number=1, value=1180.0)
+
+    @pytest.mark.parametrize(
+        "values",
+        [
+            [math.nan, 1250.5, 1180.0],
+            [1250.5, math.nan, 1180.0],
+            [1250.5, 1180.0, math.nan],
+        ],
+    )
+    def test_nan_readings_skipped(self, values):
+        """Test NaN readings are ignored wherever they appear."""
+        readings = Cylinders.from_arrays([1, 2, 3], values)
+
+        assert readings.get_hottest().value == 1250.5
+        assert readings.get_coolest().value == 1180.0
+        assert readings.get_difference() == 70.5
+
+    def test_all_nan_readings(self):
+        """Test readings that are all NaN have no extremes."""
+        readings = Cylinders.from_arrays([1, 2], [math.nan, math.nan])
+
+        assert readings.get_hottest() is None
+        assert readings.get_coolest() is None
+        assert readings.get_difference() is None
+
+    def test_large_readings(self):
+        """Test the reduction over a large array."""
+        values = np.arange(100_000, dtype=np.float64)
+        values[500] = 1e9
+        values[10] = -1.0
+        readings = Cylinders.from_arrays(np.arange(1, 100_001), values)
+
+        assert readings.get_hottest().number == 501
+        assert readings.get_coolest().number == 11
+
     def test_identical_temperatures(self):
         """Test behavior when all temperatures are identical."""
         reading1 = Cylinder(number=1, value=1200.0)
@@ -136,6 +250,20 @@ class TestCylinders:
 
         assert result == [reading1, reading2]
 
+    def test_iter_reused(self):
+        """Test scanning readings through one reused object."""
+        readings = Cylinders.from_arrays([1, 2, 3], [1200.0, 1250.5, 1180.0])
+
+        seen = []
+        objects = set()
+        for reading in readings.iter_reused():
+            seen.append((reading.number, reading.value))
+            objects.add(id(reading))
+
+        assert seen == [(1, 1200.0), (2, 1250.5), (3, 1180.0)]
+        assert len(objects) == 1
+        assert list(Cylinders([]).iter_reused()) == []
+
     def test_indexing(self):
         """Test indexing cylinder readings."""
         reading1 = Cylinder(number=1, value=1200.0)
@@ -148,6 +276,59 @@ class TestCylinders:
         with pytest.raises(IndexError):
             readings[2]
 
+    def test_slicing(self):
+        """Test slicing cylinder readings returns a list of readings."""
+        reading1 = Cylinder(number=1, value=1200.0)
+        reading2 = Cylinder(number=2, value=1250.0)
+        reading3 = Cylinder(number=3, value=1180.0)
+        readings = Cylinders([reading1, reading2, reading3])
+
+        assert readings[1:] == [reading2, reading3]
+        assert readings[-1] == reading3
+
+    def test_values_preserved_exactly(self):
+        """Test stored values round-trip without precision loss."""
+        readings = Cylinders([Cylinder(number=1, value=380.3)])
+        assert readings[0].value == 380.3
+        assert readings.to_dict() == [{"number": 1, "value": 380.3}]
+
+    def test_equality(self):
+        """Test comparing cylinder readings by content."""
+        readings = Cylinders(
+            [Cylinder(number=1, value=1200.0), Cylinder(number=2, value=1250.0)]
+        )
+        same = Cylinders.from_arrays([1, 2], [1200.0, 1250.0])
+
+        assert readings == same
+        assert hash(readings) == hash(same)
+        assert readings != Cylinders.from_arrays([1, 2], [1200.0, 1251.0])
+        assert readings != Cylinders.from_arrays([1, 3], [1200.0, 1250.0])
+        assert readings != Cylinders.from_arrays([1], [1200.0])
+        assert readings != list(readings)
+
+    def test_equal_readings_hash_alike(self):
+        """Test signed zeros and NaN readings are equal and hash alike."""
+        zero = Cylinders.from_arrays([1], [0.0])
+        negative_zero = Cylinders.from_arrays([1], [-0.0])
+        missing = Cylinders.from_arrays([1, 2], [math.nan, 1200.0])
+        other_nan = Cylinders.from_arrays([1, 2], [-np.inf + np.inf, 1200.0])
+
+        assert zero == negative_zero
+        assert hash(zero) == hash(negative_zero)
+        assert missing == missing
+        assert missing == other_nan
+        assert hash(missing) == hash(other_nan)
+        assert missing != Cylinders.from_arrays([1, 2], [1200.0, 1200.0])
+
+    def test_engine_data_equality(self):
+        """Test that EngineData compares cylinder readings by content."""
+        first = EngineData(egts=Cylinders([Cylinder(number=1, value=1200.0)]))
+        second = EngineData(egts=Cylinders.from_arrays([1], [1200.0]))
+        assert first == second
+
+        missing = Cylinders.from_arrays([1], [math.nan])
+        assert EngineData(egts=missing) == EngineData(egts=missing)
+
     def test_to_dict(self):
         """Test converting cylinder readings to dictionary format."""
         reading1 = Cylinder(number=1, value=1200.0)
@@ -163,6 +344,38 @@ class TestCylinders:
         ]
         assert result == expected
 
+    def test_to_numpy(self):
+        """Test exporting readings as read-only NumPy views."""
+        readings = Cylinders.from_arrays([1, 2], [1200.0, 1250.5])
+        numbers, values = readings.to_numpy()
+
+        assert numbers.tolist() == [1, 2]
+        assert values.tolist() == [1200.0, 1250.5]
+        assert numbers.dtype == np.int32
+        assert np.shares_memory(values, readings._values)
+
+        with pytest.raises(ValueError):
+            values[0] = 0.0
+        with pytest.raises(ValueError):
+            values.flags.writeable = True
+
+    def test_to_arrow(self):
+        """Test exporting readings as a PyArrow struct array."""
+        pa = pytest.importorskip("pyarrow")
+        readings = Cylinders.from_arrays([1, 2], [1200.0, 1250.5])
+        result = readings.to_arrow()
+
+        assert result.type == pa.struct(
+            [("number", pa.int32()), ("value", pa.float64())]
+        )
+        assert result.to_pylist() == readings.to_dict()
+
+    def test_to_arrow_without_pyarrow(self, monkeypatch):
+        """Test to_arrow raises a helpful ImportError without PyArrow."""
+        monkeypatch.setitem(sys.modules, "pyarrow", None)
+        with pytest.raises(ImportError, match="requires PyArrow"):
+            Cylinders([]).to_arrow()
+
     def test_to_dict_empty(self):
         """Test to_dict with empty readings."""
         readings = Cylinders([])
@@ -170,6 +383,391 @@ class TestCylinders:
         assert result == []
 
 
+class TestMinmaxKernel:
+    """Test cases for the optional Numba reduction kernel."""
+
+    @pytest.fixture
+    def kernels(self):
+        """The compiled kernels module, skipped when Numba is not installed."""
+        pytest.importorskip("numba")
+        from aerotrace.models import _kernels
+
+        return _kernels
+
+    def test_minmax(self, kernels):
+        """Test the kernel finds the first coolest and hottest positions."""
+        values = np.array([1200.0, 1250.5, 1180.0, 1250.5, 1180.0])
+        assert kernels.minmax(values) == (2, 1)
+        assert kernels.minmax(np.array([1200.0])) == (0, 0)
+
+    def test_minmax_skips_nan(self, kernels):
+        """Test the kernel ignores NaN readings wherever they appear."""
+        nan = math.nan
+        assert kernels.minmax(np.array([nan, 1250.5, 1180.0])) == (2, 1)
+        assert kernels.minmax(np.array([1250.5, nan, 1180.0])) == (2, 0)
+        assert kernels.minmax(np.array([nan, nan])) == (-1, -1)
+
+    def test_matches_numpy_path(self, kernels, monkeypatch):
+        """Test the kernel and argmin/argmax reductions agree."""
+        readings = Cylinders.from_arrays([1, 2, 3, 4], [1200.0, 1250.5, 1180.0, 1210.0])
+        compiled = readings._minmax()
+
+        monkeypatch.setattr(engine, "_minmax_kernel", None)
+        assert readings._minmax() == compiled == (2, 1)
+
+
+class TestCylindersFromArrays:
+    """Test cases for the bulk Cylinders constructors."""
+
+    def test_from_arrays(self):
+        """Test building readings from number and value arrays."""
+        readings = Cylinders.from_arrays([1, 2, 3], [1200.0, 1250.5, 1180.0])
+
+        assert len(readings) == 3
+        assert list(readings) == [
+            Cylinder(number=1, value=1200.0),
+            Cylinder(number=2, value=1250.5),
+            Cylinder(number=3, value=1180.0),
+        ]
+        assert readings.get_hottest() == Cylinder(number=2, value=1250.5)
+        assert readings.get_difference() == 70.5
+
+    def test_from_arrays_empty(self):
+        """Test building empty readings from arrays."""
+        readings = Cylinders.from_arrays([], [])
+        assert len(readings) == 0
+        assert readings.get_hottest() is None
+
+    def test_from_arrays_validation(self):
+        """Test validation of array inputs."""
+        with pytest.raises(ValueError, match="Cylinder number must be >= 1"):
+            Cylinders.from_arrays([0, 1], [1200.0, 1250.0])
+
+        with pytest.raises(ValueError, match="same length"):
+            Cylinders.from_arrays([1, 2], [1200.0])
+
+        with pytest.raises(ValueError, match="one-dimensional"):
+            Cylinders.from_arrays([[1, 2]], [[1200.0, 1250.0]])
+
+    def test_from_arrays_copies_writable_input(self):
+        """Test later changes to caller arrays do not alter the readings."""
+        values = np.array([1200.0, 1250.5, 1180.0])
+        numbers = np.array([1, 2, 3], dtype=np.int32)
+        readings = Cylinders.from_arrays(numbers, values)
+        assert readings.get_hottest().number == 2
+        before = hash(readings)
+
+        values[0] = 1400.0
+        numbers[1] = 9
+
+        assert readings.get_hottest() == Cylinder(number=2, value=1250.5)
+        assert readings[1].number == 2
+        assert hash(readings) == before
+
+    def test_from_arrays_shares_immutable_input(self):
+        """Test arrays over an immutable buffer are not copied."""
+        values = np.frombuffer(np.array([1200.0, 1250.5]).tobytes(), dtype=np.float64)
+        readings = Cylinders.from_arrays([1, 2], values)
+
+        assert np.shares_memory(readings._values, values)
+
+    def test_from_arrays_copies_read_only_view_of_writable_input(self):
+        """Test read-only arrays whose memory can still be written are copied."""
+        values = np.array([1200.0, 1250.5])
+        view = values.view()
+        view.flags.writeable = False
+        buffered = np.frombuffer(bytearray(values.tobytes()), dtype=np.float64)
+        buffered.flags.writeable = False
+        owned = values.copy()
+        owned.flags.writeable = False
+
+        for read_only in (view, buffered, owned):
+            readings = Cylinders.from_arrays([1, 2], read_only)
+            assert not np.shares_memory(readings._values, read_only)
+
+        # The owner of an array can make it writeable again
+        readings.get_hottest()
+        before = hash(readings)
+        owned.flags.writeable = True
+        owned[0] = 9999.0
+
+        assert readings[0] == Cylinder(number=1, value=1200.0)
+        assert readings.get_hottest() == Cylinder(number=2, value=1250.5)
+        assert hash(readings) == before
+
+    def test_from_arrays_number_out_of_range(self):
+        """Test numbers that would wrap when cast to int32 are rejected."""
+        with pytest.raises(ValueError, match="must fit in int32"):
+            Cylinders.from_arrays(np.array([2**32 + 1]), [1200.0])
+
+        with pytest.raises(ValueError, match="must fit in int32"):
+            Cylinders.from_arrays([math.inf], [1200.0])
+
+    @pytest.mark.parametrize("number", [math.nan, 1.5, True, "1"])
+    def test_from_arrays_number_not_integer(self, number):
+        """Test numbers that the int32 cast would truncate are rejected."""
+        with pytest.raises(ValueError, match="must be an integer"):
+            Cylinders.from_arrays([number], [1200.0])
+
+    def test_from_arrays_whole_float_numbers(self):
+        """Test whole-valued float numbers are accepted."""
+        readings = Cylinders.from_arrays(np.array([1.0, 2.0]), [1200.0, 1250.0])
+        assert readings.to_dict()[1] == {"number": 2, "value": 1250.0}
+
+    def test_from_lists(self):
+        """Test the trusted constructor used by parsers."""
+        readings = Cylinders._from_lists([1, 3], [1200.0, 1250.5])
+        assert readings == Cylinders.from_arrays([1, 3], [1200.0, 1250.5])
+
+        first = Cylinders._from_lists(None, [1200.0, 1250.5])
+        second = Cylinders._from_lists(None, [1180.0, 1190.0])
+        assert first == Cylinders.from_arrays([1, 2], [1200.0, 1250.5])
+        assert first._numbers is second._numbers
+        assert not first._numbers.flags.writeable
+
+    def test_from_buffer(self):
+        """Test building readings from packed records."""
+        records = np.array([(1, 1200.0), (2, 1250.5)], dtype=CYLINDER_DTYPE)
+        readings = Cylinders.from_buffer(records.tobytes())
+
+        assert list(readings) == [
+            Cylinder(number=1, value=1200.0),
+            Cylinder(number=2, value=1250.5),
+        ]
+
+    def test_from_buffer_count(self):
+        """Test reading only the first records from a buffer."""
+        records = np.array([(1, 1200.0), (2, 1250.5)], dtype=CYLINDER_DTYPE)
+        readings = Cylinders.from_buffer(records.tobytes(), count=1)
+
+        assert list(readings) == [Cylinder(number=1, value=1200.0)]
+
+
+class TestEngineDataFrameFile:
+    """Test cases for EngineDataFrame packed record I/O."""
+
+    @pytest.fixture
+    def frame(self):
+        """Frame with two samples and a missing cylinder."""
+        return EngineDataFrame.from_engine_data(
+            [
+                EngineData(
+                    rpm=RPM(left=2400, right=2380),
+                    manifold_pressure=24.5,
+                    egts=Cylinders.from_arrays([1, 2, 3], [1200.0, 1250.5, 1180.0]),
+                    chts=Cylinders.from_arrays([1, 2], [380.0, 395.0]),
+                    oil=Oil(pressure=85.0, pressure_alert=True),
+                ),
+                EngineData(egts=Cylinders.from_arrays([3], [1190.0])),
+            ]
+        )
+
+    def test_to_records(self, frame):
+        """Test packing a frame into fixed-size records."""
+        records = frame.to_records()
+
+        assert records.dtype == ENGINE_DATA_DTYPE
+        assert records["egts"].shape == (2, MAX_CYLINDERS)
+        assert records["rpm_left"][0] == 2400.0
+        assert records["oil_pressure_alert"].tolist() == [True, False]
+        assert np.isnan(records["egts"][0, 3:]).all()
+
+    def test_file_round_trip(self, frame, tmp_path):
+        """Test writing and reloading a frame."""
+        path = tmp_path / "flight.bin"
+        frame.to_file(path)
+
+        assert path.stat().st_size == 2 * ENGINE_DATA_DTYPE.itemsize
+
+        loaded = EngineDataFrame.from_file(path)
+        assert loaded.egts.shape == (2, 3)
+        assert loaded.chts.shape == (2, 2)
+        assert loaded.egts.flags.c_contiguous
+        assert [data.to_dict() for data in loaded] == [data.to_dict() for data in frame]
+
+    def test_file_not_found(self, tmp_path):
+        """Test loading a missing file."""
+        with pytest.raises(FileNotFoundError):
+            EngineDataFrame.from_file(tmp_path / "missing.bin")
+
+    def test_too_many_cylinders(self):
+        """Test frames wider than the record layout are rejected."""
+        count = MAX_CYLINDERS + 1
+        frame = EngineDataFrame.from_engine_data(
+            [
+                EngineData(
+                    egts=Cylinders.from_arrays(range(1, count + 1), [1200.0] * count)
+                )
+            ]
+        )
+
+        with pytest.raises(ValueError, match="records hold at most"):
+            frame.to_records()
+
+
+class TestMakeCylindersClass:
+    """Test cases for Cylinders subclasses generated per cylinder count."""
+
+    VALUES = (1200.0, 1250.5, 1180.0, 1250.5, 1180.0, 1210.0)
+
+    def test_class_cached(self):
+        """Test that each count generates one class."""
+        cls = make_cylinders_class(6)
+        assert cls is make_cylinders_class(6)
+        assert cls is not make_cylinders_class(4)
+        assert issubclass(cls, Cylinders)
+        assert cls.__name__ == "Cylinders6"
+
+    @pytest.mark.parametrize("use_kernel", [True, False])
+    def test_matches_generic(self, use_kernel, monkeypatch):
+        """Test the unrolled reduction agrees with the generic one."""
+        if not use_kernel:
+            monkeypatch.setattr(engine, "_minmax_kernel", None)
+
+        numbers = range(1, len(self.VALUES) + 1)
+        generic = Cylinders.from_arrays(numbers, self.VALUES)
+        fixed = make_cylinders_class(6).from_arrays(numbers, self.VALUES)
+
+        assert fixed == generic
+        assert fixed.get_hottest() == generic.get_hottest()
+        assert fixed.get_coolest() == generic.get_coolest()
+        assert fixed.get_coolest() == Cylinder(number=3, value=1180.0)
+        assert fixed.get_difference() == generic.get_difference() == 70.5
+
+    @pytest.mark.parametrize("use_kernel", [True, False])
+    def test_nan_readings_skipped(self, use_kernel, monkeypatch):
+        """Test the unrolled reduction skips NaN readings like the generic one."""
+        if not use_kernel:
+            monkeypatch.setattr(engine, "_minmax_kernel", None)
+
+        cls = make_cylinders_class(3)
+        readings = cls.from_arrays([1, 2, 3], [math.nan, 1250.5, 1180.0])
+        assert readings.get_hottest() == Cylinder(number=2, value=1250.5)
+        assert readings.get_coolest() == Cylinder(number=3, value=1180.0)
+
+        missing = cls.from_arrays([1, 2, 3], [math.nan] * 3)
+        assert missing.get_hottest() is None
+        assert missing.get_difference() is None
+
+    def test_single_cylinder(self):
+        """Test a class generated for one cylinder."""
+        readings = make_cylinders_class(1)([Cylinder(number=1, value=1200.0)])
+        assert readings.get_difference() == 0.0
+
+    def test_wrong_count(self):
+        """Test that instances must hold exactly the generated count."""
+        with pytest.raises(ValueError, match="requires exactly 6 readings"):
+            make_cylinders_class(6).from_arrays([1, 2], [1200.0, 1250.0])
+
+        with pytest.raises(ValueError, match="Cylinder count must be >= 1"):
+            make_cylinders_class(0)
+
+    def test_pickle(self):
+        """Test generated instances survive pickling."""
+        readings = make_cylinders_class(3).from_arrays([1, 2, 3], self.VALUES[:3])
+        restored = pickle.loads(pickle.dumps(readings))
+
+        assert type(restored) is type(readings)
+        assert restored == readings
+
+
+class TestCylindersWithoutNumpy:
+    """Test cases for the stdlib array fallback used when NumPy is missing."""
+
+    @pytest.fixture(autouse=True)
+    def no_numpy(self, monkeypatch):
+        """Run each test as if NumPy (and therefore Numba) were not installed."""
+        monkeypatch.setattr(engine, "np", None)
+        monkeypatch.setattr(engine, "_minmax_kernel", None)
+
+    def test_storage(self):
+        """Test readings are stored in stdlib arrays."""
+        readings = Cylinders([Cylinder(number=1, value=1200.0)])
+        assert isinstance(readings._numbers, array)
+        assert isinstance(readings._values, array)
+
+    def test_readings(self):
+        """Test the collection behaves as with NumPy storage."""
+        reading1 = Cylinder(number=1, value=1200.0)
+        reading2 = Cylinder(number=2, value=1250.5)
+        reading3 = Cylinder(number=3, value=1180.0)
+        readings = Cylinders([reading1, reading2, reading3])
+
+        assert len(readings) == 3
+        assert list(readings) == [reading1, reading2, reading3]
+        assert readings[1] == reading2
+        assert readings.get_hottest() == reading2
+        assert readings.get_coolest() == reading3
+        assert readings.get_difference() == 70.5
+        assert readings.to_dict()[0] == {"number": 1, "value": 1200.0}
+
+        with pytest.raises(IndexError):
+            readings[3]
+
+    def test_nan_readings_skipped(self):
+        """Test the pure-Python pass ignores NaN readings."""
+        for values in ([math.nan, 1250.5, 1180.0], [1250.5, 1180.0, math.nan]):
+            readings = Cylinders.from_arrays([1, 2, 3], values)
+            assert readings.get_difference() == 70.5
+
+        assert Cylinders.from_arrays([1], [math.nan]).get_hottest() is None
+
+    def test_equal_readings_hash_alike(self):
+        """Test signed zeros and NaN readings are equal and hash alike."""
+        zero = Cylinders.from_arrays([1], [0.0])
+        negative_zero = Cylinders.from_arrays([1], [-0.0])
+        missing = Cylinders.from_arrays([1, 2], [math.nan, 1200.0])
+        other_nan = Cylinders.from_arrays([1, 2], [-math.inf + math.inf, 1200.0])
+
+        assert zero == negative_zero
+        assert hash(zero) == hash(negative_zero)
+        assert missing == other_nan
+        assert hash(missing) == hash(other_nan)
+        assert missing != Cylinders.from_arrays([1, 2], [1200.0, 1200.0])
+
+    def test_empty(self):
+        """Test empty readings."""
+        readings = Cylinders([])
+        assert len(readings) == 0
+        assert readings.get_hottest() is None
+        assert readings.get_difference() is None
+
+    def test_from_arrays(self):
+        """Test bulk construction and equality."""
+        readings = Cylinders.from_arrays([1, 2], [1200.0, 1250.0])
+
+        assert readings == Cylinders(
+            [Cylinder(number=1, value=1200.0), Cylinder(number=2, value=1250.0)]
+        )
+        assert readings != Cylinders.from_arrays([1, 2], [1200.0, 1251.0])
+
+        with pytest.raises(ValueError, match="Cylinder number must be >= 1"):
+            Cylinders.from_arrays([0], [1200.0])
+
+        with pytest.raises(ValueError, match="same length"):
+            Cylinders.from_arrays([1, 2], [1200.0])
+
+        with pytest.raises(ValueError, match="must fit in int32"):
+            Cylinders.from_arrays([2**40], [1200.0])
+
+        for number in (math.nan, 1.5, "1"):
+            with pytest.raises(ValueError, match="must be an integer"):
+                Cylinders.from_arrays([number], [1200.0])
+
+        assert Cylinders.from_arrays([2.0], [1200.0])[0].number == 2
+
+    def test_numpy_only_features(self):
+        """Test NumPy-only features raise a helpful ImportError."""
+        with pytest.raises(ImportError, match="requires NumPy"):
+            Cylinders.from_buffer(b"")
+
+        with pytest.raises(ImportError, match="requires NumPy"):
+            Cylinders([]).to_numpy()
+
+        with pytest.raises(ImportError, match="requires NumPy"):
+            EngineDataFrame.from_engine_data([])
+
+
 class TestRPM:
     """Test cases for the RPM class."""
 
@@ -211,9 +809,9 @@ class TestFuel:
     def test_default_fuel(self):
         """Test creating Fuel with default values."""
         fuel = Fuel()
-        assert fuel.pressure is None
-        assert fuel.flow is None
-        assert fuel.quantity is None
+        assert math.isnan(fuel.pressure)
+        assert math.isnan(fuel.flow)
+        assert math.isnan(fuel.quantity)
         assert fuel.pressure_alert is False
         assert fuel.quantity_alert is False
         assert fuel.has_active_alert is False
@@ -246,8 +844,8 @@ class TestOil:
     def test_default_oil(self):
         """Test creating Oil with default values."""
         oil = Oil()
-        assert oil.pressure is None
-        assert oil.temperature is None
+        assert math.isnan(oil.pressure)
+        assert math.isnan(oil.temperature)
         assert oil.pressure_alert is False
         assert oil.temperature_alert is False
         assert oil.has_active_alert is False
@@ -279,8 +877,8 @@ class TestElectrical:
     def test_default_electrical(self):
         """Test creating Electrical with default values."""
         electrical = Electrical()
-        assert electrical.volts is None
-        assert electrical.amps is None
+        assert math.isnan(electrical.volts)
+        assert math.isnan(electrical.amps)
 
     def test_electrical_with_values(self):
         """Test creating Electrical with specific values."""
@@ -298,6 +896,61 @@ class TestElectrical:
 class TestEngineData:
     """Test cases for the EngineData class."""
 
+    @pytest.mark.skipif(
+        sys.version_info < (3, 10), reason="dataclass slots require Python 3.10+"
+    )
+    def test_uses_slots(self):
+        """Test that samples and their components carry no instance dict."""
+        engine_data = EngineData()
+        for part in (
+            engine_data,
+            engine_data.rpm,
+            engine_data.fuel,
+            engine_data.oil,
+            engine_data.electrical,
+        ):
+            assert not hasattr(part, "__dict__")
+
+    def test_default_cylinders_shared(self):
+        """Test that default EGT/CHT readings share one empty instance."""
+        first = EngineData()
+        second = EngineData()
+
+        assert first.egts is second.egts
+        assert first.egts is first.chts
+        assert len(first.egts) == 0
+        assert first.egts.get_difference() is None
+
+    def test_default_missing_values(self):
+        """Test that unset float readings default to NaN."""
+        engine_data = EngineData()
+        assert math.isnan(engine_data.manifold_pressure)
+        assert math.isnan(engine_data.g_force)
+        assert engine_data.rpm.left is None
+
+    def test_missing_values_compare_equal(self):
+        """Test that samples with missing readings compare equal."""
+        assert EngineData(g_force=float("nan")) == EngineData()
+        assert EngineData(g_force=np.float64("nan")) == EngineData()
+        assert EngineData(g_force=np.float32("nan")) == EngineData()
+        assert EngineData(g_force=np.float32("nan")).to_dict()["g_force"] is None
+        assert EngineData(fuel=Fuel(flow=float("nan"))) == EngineData()
+        assert EngineData(g_force=1.2) != EngineData()
+        assert EngineData(fuel=Fuel(flow=45.2)) != EngineData()
+
+    def test_pickle_round_trip(self):
+        """Test that samples survive pickling unchanged."""
+        for engine_data in (
+            EngineData(),
+            EngineData(
+                rpm=RPM(left=2400),
+                egts=Cylinders([Cylinder(number=1, value=1200.0)]),
+                oil=Oil(pressure=85.0),
+                g_force=1.2,
+            ),
+        ):
+            assert pickle.loads(pickle.dumps(engine_data)) == engine_data
+
     def test_to_dict_default(self):
         """Test to_dict with default EngineData."""
         engine_data = EngineData()
@@ -376,3 +1029,100 @@ class TestEngineData:
         }
 
         assert result == expected
+
+
+class TestEngineDataFrame:
+    """Test cases for the EngineDataFrame columnar batch."""
+
+    @pytest.fixture
+    def samples(self):
+        """Two samples, the second with missing values and a missing cylinder."""
+        return [
+            EngineData(
+                rpm=RPM(left=2400, right=2380, computed=2390),
+                manifold_pressure=24.5,
+                egts=Cylinders(
+                    [Cylinder(number=1, value=1200.0), Cylinder(number=2, value=1250.0)]
+                ),
+                chts=Cylinders(
+                    [Cylinder(number=1, value=380.0), Cylinder(number=2, value=395.0)]
+                ),
+                fuel=Fuel(pressure=25.5, flow=45.2, quantity=120.0),
+                oil=Oil(pressure=85.0, temperature=180.0, temperature_alert=True),
+                electrical=Electrical(volts=14.2, amps=12.5),
+                g_force=1.2,
+            ),
+            EngineData(
+                rpm=RPM(left=2300),
+                egts=Cylinders([Cylinder(number=2, value=1300.0)]),
+                fuel=Fuel(quantity_alert=True),
+            ),
+        ]
+
+    def test_columns(self, samples):
+        """Test that samples are laid out as columns."""
+        frame = EngineDataFrame.from_engine_data(samples)
+
+        assert len(frame) == 2
+        assert frame.rpm_left.tolist() == [2400.0, 2300.0]
+        assert frame.manifold_pressure[0] == 24.5
+        assert np.isnan(frame.manifold_pressure[1])
+        assert frame.fuel_quantity_alert.tolist() == [False, True]
+        assert frame.egts.shape == (2, 2)
+        assert np.isnan(frame.egts[1, 0])
+        assert frame.egts[1, 1] == 1300.0
+
+    def test_aggregates(self, samples):
+        """Test vectorised aggregates across samples."""
+        frame = EngineDataFrame.from_engine_data(samples)
+
+        assert np.nanmax(frame.egts, axis=1).tolist() == [1250.0, 1300.0]
+        assert np.nanmean(frame.rpm_left) == 2350.0
+
+    def test_round_trip(self, samples):
+        """Test that indexing rebuilds the original samples."""
+        frame = EngineDataFrame.from_engine_data(samples)
+
+        assert [data.to_dict() for data in frame] == [
+            data.to_dict() for data in samples
+        ]
+        assert frame[-1].egts[0] == Cylinder(number=2, value=1300.0)
+        assert len(frame[1].chts) == 0
+        assert frame[np.int64(0)] == samples[0]
+
+    def test_non_integer_index(self, samples):
+        """Test that indexing rejects slices and other non-integers."""
+        frame = EngineDataFrame.from_engine_data(samples)
+
+        for index in (slice(0, 1), 0.0, [0]):
+            with pytest.raises(TypeError, match="indices must be integers"):
+                frame[index]
+
+    def test_duplicate_cylinder_numbers(self):
+        """Test that a sample repeating a cylinder number is rejected."""
+        samples = [EngineData(egts=Cylinders.from_arrays([1, 1], [100.0, 200.0]))]
+
+        with pytest.raises(ValueError, match="Duplicate cylinder number in sample 0"):
+            EngineDataFrame.from_engine_data(samples)
+
+    def test_empty(self):
+        """Test building a frame from no samples."""
+        frame = EngineDataFrame.from_engine_data([])
+
+        assert len(frame) == 0
+        assert frame.egts.shape == (0, 0)
+        assert list(frame) == []
+
+    def test_mismatched_lengths(self, samples):
+        """Test that columns of different lengths are rejected."""
+        frame = EngineDataFrame.from_engine_data(samples)
+        columns = {name: getattr(frame, name) for name in vars(frame)}
+        columns["g_force"] = columns["g_force"][:1]
+
+        with pytest.raises(ValueError, match="same number of samples"):
+            EngineDataFrame(**columns)
+
+        columns["g_force"] = frame.g_force
+        columns["egts"] = frame.egts[:, 0]
+        with pytest.raises(ValueError, match="egts must be a"):
+            EngineDataFrame(**columns)
@@ -5,6 +5,7 @@ Tests for aerotrace.parsers.cgr30p module.
 import pytest
 from pathlib import Path
 
+from aerotrace.models import Cylinders, is_missing, make_cylinders_class
 from aerotrace.parsers import cgr30p
 
 
@@ -215,10 +216,10 @@ class TestParseFile:
         assert data.rpm.left is None  # "abc" should be None
         assert data.rpm.right is None  # "def" should be None
         assert data.rpm.computed is None  # "ghi" should be None
-        assert data.manifold_pressure is None  # "invalid" should be None
-        assert data.fuel.quantity is None  # "INVALID_QTY" should be None
-        assert data.electrical.amps is None  # "not_numeric" should be None
-        assert data.fuel.flow is None  # "text" should be None
+        assert is_missing(data.manifold_pressure)  # "invalid" should be missing
+        assert is_missing(data.fuel.quantity)  # "INVALID_QTY" should be missing
+        assert is_missing(data.electrical.amps)  # "not_numeric" should be missing
+        assert is_missing(data.fuel.flow)  # "text" should be missing
 
     def test_float_to_int_conversion(self, tmp_path):
         """Test that float values are properly converted to integers for RPM."""
@@ -271,6 +272,19 @@ class TestParseFile:
         assert data.egts[1].number == 3
         assert data.egts[1].value == 1200
 
+        # Partial rows keep the generic collection rather than the 6-cylinder class
+        assert type(data.egts) is Cylinders
+
+    def test_full_cylinder_rows_use_fixed_class(self, test_data_dir):
+        """Test that rows with every cylinder use the specialised class."""
+        file_path = test_data_dir / "cgr30p_test_basic.csv"
+        data = list(cgr30p.parse_file(file_path))[1]
+
+        assert type(data.egts) is make_cylinders_class(6)
+        assert type(data.chts) is make_cylinders_class(6)
+        assert data.egts.get_hottest().number == 2
+        assert data.egts.get_difference() == 228.0
+
     def test_empty_and_zero_values(self, tmp_path):
         """Test handling of empty strings and zero values."""
         data_row = "11:53:32,,0,,0,0.0,0,,,,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0.0,  0.00,  1.62,0,0.0,0.0,0.0,0,0,0, 99:59,  0:00,  0:00,0.0, 99:59,0,0,0,0.0,0,0,100.0,0,"
@@ -284,7 +298,7 @@ class TestParseFile:
         data = engine_data_list[0]
         assert data.rpm.left == 0  # Zero values should be preserved
         assert data.rpm.right is None  # Empty string should be None
-        assert data.fuel.quantity is None  # Empty tank quantity string
+        assert is_missing(data.fuel.quantity)  # Empty tank quantity string
         assert data.manifold_pressure == 0.0  # Zero float preserved
         assert len(data.egts) == 6  # All cylinders present even with zero values
         assert len(data.chts) == 6  # All cylinders present even with zero values